@@ -5,149 +5,381 @@ Parses JavaScript/JSX files and extracts React API calls using AST analysis.
 
 import os
 import re
+import sys
 import json
+import mmap
+import hashlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+# esprima is heavy to import, so it is only loaded by the first AST parse
+HAS_ESPRIMA = importlib.util.find_spec("esprima") is not None
+esprima = None
+Node = None
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
 
 try:
-    import esprima
-    HAS_ESPRIMA = True
+    import pcre2
+    HAS_PCRE2 = True
 except ImportError:
-    HAS_ESPRIMA = False
+    HAS_PCRE2 = False
 
 
 # ─── Known React API patterns ──────────────────────────────────
-REACT_HOOKS = {
+# Names are interned so every file's results share the same string objects.
+REACT_HOOKS = frozenset(map(sys.intern, (
     "useState", "useEffect", "useContext", "useReducer",
     "useCallback", "useMemo", "useRef", "useImperativeHandle",
     "useLayoutEffect", "useDebugValue", "useId", "useTransition",
     "useDeferredValue", "useInsertionEffect", "useSyncExternalStore",
-}
+)))
 
 REACT_MEMBER_APIS = {
-    "ReactDOM": {
+    "ReactDOM": frozenset(map(sys.intern, (
         "render", "hydrate", "unmountComponentAtNode",
         "findDOMNode", "createPortal", "flushSync",
-    },
-    "React": {
+    ))),
+    "React": frozenset(map(sys.intern, (
         "createElement", "cloneElement", "createRef",
         "forwardRef", "memo", "lazy", "createContext",
         "isValidElement", "startTransition",
-    },
+    ))),
 }
 
-REACT_COMPONENT_APIS = {
+REACT_COMPONENT_APIS = frozenset(map(sys.intern, (
     "React.Component", "React.PureComponent", "React.Fragment",
     "React.Suspense", "React.StrictMode", "React.Profiler",
-}
+)))
 
-REACT_IMPORTS = {
+REACT_IMPORTS = frozenset(map(sys.intern, (
     "createRoot", "hydrateRoot",
+)))
+
+# Flattened lookups for the AST walker: one hashed test per member access
+_MEMBER_ROOTS = frozenset(REACT_MEMBER_APIS)
+_MEMBER_FULL = frozenset(
+    sys.intern(f"{obj}.{prop}")
+    for obj, props in REACT_MEMBER_APIS.items()
+    for prop in props
+)
+
+# Every API name the extractors can report
+_ALL_AST_APIS = (
+    _MEMBER_FULL | REACT_HOOKS | REACT_IMPORTS | REACT_COMPONENT_APIS
+    | {sys.intern("React.Children.map")}
+)
+
+# Maps a freshly built or parsed name to its canonical interned instance
+_INTERNED_APIS = {name: name for name in _ALL_AST_APIS}
+
+# ─── Regex fallback ────────────────────────────────────────────
+# All fallback patterns combined into one alternation so the file is
+# scanned once. Each named group holds the API name to report.
+#
+# Engine preference: Hyperscan -> PCRE2 with JIT -> re.
+_REGEX_FALLBACK_PATTERN = (
+    r"(?P<reactdom>ReactDOM\.(?:render|hydrate|unmountComponentAtNode|findDOMNode|createPortal|flushSync))\s*\("
+    r"|(?P<react>React\.(?:createElement|cloneElement|createRef|forwardRef|memo|lazy|createContext|isValidElement|startTransition))\s*[\(\<]"
+    r"|\b(?P<hook>useState|useEffect|useContext|useReducer|useCallback|useMemo|useRef|useImperativeHandle|useLayoutEffect|useDebugValue|useId|useTransition|useDeferredValue|useInsertionEffect|useSyncExternalStore)\s*\("
+    r"|\b(?P<new_api>createRoot|hydrateRoot)\s*\("
+    r"|extends\s+(?P<cls>React\.(?:Component|PureComponent))"
+    r"|(?P<component>React\.(?:Fragment|StrictMode|Suspense|Profiler))"
+    r"|(?P<children>React\.Children\.\w+)"
+)
+
+_REGEX_FALLBACK = re.compile(_REGEX_FALLBACK_PATTERN)
+if HAS_PCRE2:
+    try:
+        # JIT-compiled to native code; same finditer/lastgroup API as re
+        _REGEX_FALLBACK = pcre2.compile(_REGEX_FALLBACK_PATTERN, jit=True)
+    except pcre2.error:
+        pass
+
+
+def _hyperscan_expressions() -> list:
+    """
+    Build (pattern, api_name) pairs matching the same calls as _REGEX_FALLBACK.
+
+    Hyperscan has no capture groups, so each API gets its own expression
+    and the expression ID identifies what was found.
+    """
+    expressions = []
+    for name in sorted(REACT_MEMBER_APIS["ReactDOM"]):
+        expressions.append((rf"ReactDOM\.{name}\s*\(", f"ReactDOM.{name}"))
+    for name in sorted(REACT_MEMBER_APIS["React"]):
+        expressions.append((rf"React\.{name}\s*[\(\<]", f"React.{name}"))
+    for name in sorted(REACT_HOOKS | REACT_IMPORTS):
+        expressions.append((rf"\b{name}\s*\(", name))
+    for name in ("Component", "PureComponent"):
+        expressions.append((rf"extends\s+React\.{name}", f"React.{name}"))
+    for name in ("Fragment", "StrictMode", "Suspense", "Profiler"):
+        expressions.append((rf"React\.{name}", f"React.{name}"))
+    expressions.append((r"React\.Children\.\w+", "React.Children.map"))
+    return expressions
+
+
+def _compile_hyperscan() -> tuple:
+    """Compile the fallback expressions into a single block-mode database."""
+    expressions = _hyperscan_expressions()
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for pattern, _ in expressions],
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        # Report each API at most once per scan, which is all a set needs
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+    )
+    return database, [_INTERNED_APIS.get(api, api) for _, api in expressions]
+
+
+_HS_DATABASE = None
+_HS_APIS = []
+
+
+def _hyperscan_database():
+    """Compile the Hyperscan database on first use; None if unavailable."""
+    global HAS_HYPERSCAN, _HS_DATABASE, _HS_APIS
+    if HAS_HYPERSCAN and _HS_DATABASE is None:
+        try:
+            _HS_DATABASE, _HS_APIS = _compile_hyperscan()
+        except hyperscan.error:
+            # Unsupported platform or pattern; fall back to re
+            HAS_HYPERSCAN = False
+    return _HS_DATABASE
+
+# Projects smaller than this are scanned in-process
+_PARALLEL_MIN_FILES = 32
+
+# Files above this size skip AST parsing and use the regex fallback
+_MAX_FILE_BYTES = int(os.environ.get("BREAKGUARD_MAX_BYTES", 2_000_000))
+# Bytes inspected when checking whether a file is minified
+_MINIFIED_PEEK_BYTES = 8192
+
+# ─── Result cache ──────────────────────────────────────────────
+# Bump ANALYZER_VERSION whenever extraction output changes so stale
+# cache entries are ignored.
+ANALYZER_VERSION = "1"
+_CACHE_ENABLED = os.environ.get("BREAKGUARD_CACHE", "1") != "0"
+_CACHE_DIR = os.environ.get("BREAKGUARD_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "breakguard"
+)
+
+
+def _cache_path(digest: str) -> str:
+    """Return the cache file path for a content digest."""
+    return os.path.join(
+        _CACHE_DIR, f"v{ANALYZER_VERSION}", digest[:2], f"{digest}.json"
+    )
+
+
+def _cache_load(digest: str):
+    """Return cached API calls for a digest, or None on a miss."""
+    try:
+        with open(_cache_path(digest), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_store(digest: str, api_calls: list) -> None:
+    """Write API calls to the cache. Failures are ignored."""
+    path = _cache_path(digest)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(api_calls, f)
+        # Atomic rename so concurrent scan workers never see partial files
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+# ─── AST node handlers ─────────────────────────────────────────
+def _node_name(node) -> str:
+    """Return the identifier name of an AST node, or "" if it has none."""
+    name = getattr(node, "name", None)
+    return name if isinstance(name, str) else ""
+
+
+def _handle_member_expression(node, api_calls: set) -> None:
+    """MemberExpression: ReactDOM.render, React.createElement."""
+    obj_name = _node_name(node.object)
+    if obj_name not in _MEMBER_ROOTS:
+        return
+
+    prop_name = _node_name(node.property)
+    full_name = obj_name + "." + prop_name
+    if full_name in _MEMBER_FULL:
+        api_calls.add(_INTERNED_APIS[full_name])
+
+    # React.Children.map
+    elif full_name == "React.Children":
+        api_calls.add("React.Children.map")
+
+
+def _handle_call_expression(node, api_calls: set) -> None:
+    """CallExpression: useState(), useEffect(), etc."""
+    callee_name = _node_name(node.callee)
+
+    if callee_name in REACT_HOOKS or callee_name in REACT_IMPORTS:
+        api_calls.add(_INTERNED_APIS[callee_name])
+
+
+def _handle_class_declaration(node, api_calls: set) -> None:
+    """ClassDeclaration: extends React.Component."""
+    superclass = node.superClass
+    if superclass is not None:
+        prop_name = _node_name(superclass.property)
+        if _node_name(superclass.object) == "React" and prop_name in (
+            "Component",
+            "PureComponent",
+        ):
+            api_calls.add(_INTERNED_APIS["React." + prop_name])
+
+
+def _handle_jsx_member_expression(node, api_calls: set) -> None:
+    """JSXMemberExpression: <React.Fragment>, <React.StrictMode>."""
+    if _node_name(node.object) == "React":
+        comp_name = "React." + _node_name(node.property)
+        if comp_name in REACT_COMPONENT_APIS:
+            api_calls.add(_INTERNED_APIS[comp_name])
+
+
+def _handle_import_declaration(node, api_calls: set) -> None:
+    """ImportDeclaration: track imports."""
+    for spec in node.specifiers or ():
+        name = _node_name(spec.imported) or _node_name(spec.local)
+        if name in REACT_IMPORTS or name in REACT_HOOKS:
+            api_calls.add(_INTERNED_APIS[name])
+
+
+_NODE_HANDLERS = {
+    "MemberExpression": _handle_member_expression,
+    "CallExpression": _handle_call_expression,
+    "ClassDeclaration": _handle_class_declaration,
+    "JSXMemberExpression": _handle_jsx_member_expression,
+    "ImportDeclaration": _handle_import_declaration,
 }
 
+# Leaf node types: no handler and no child nodes worth visiting
+_OPAQUE_TYPES = frozenset({
+    "Literal", "Identifier", "TemplateElement", "JSXText", "JSXIdentifier",
+})
+
+# esprima options shared by every parse
+_PARSE_OPTIONS = {"jsx": True, "tolerant": True}
+
+# Extensions that are almost always ES modules
+_MODULE_EXTENSIONS = (".mjs", ".jsx", ".ts", ".tsx")
+
 
 def extract_api_calls_ast(file_path: str) -> list:
     """
     Extract React API calls from a JavaScript/JSX file using AST parsing.
 
+    Results are cached on disk by file content hash, so unchanged files
+    are not re-parsed on later runs. Files larger than BREAKGUARD_MAX_BYTES
+    or that look minified are scanned with the regex fallback instead.
+
     Args:
         file_path: Path to the JS/JSX file.
 
     Returns:
         List of API call strings found in the file.
     """
-    if not HAS_ESPRIMA:
+    if not HAS_ESPRIMA or os.stat(file_path).st_size > _MAX_FILE_BYTES:
         return extract_api_calls_regex(file_path)
 
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        code = f.read()
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    # Minified bundles are one huge line that esprima parses very slowly
+    head = data[:_MINIFIED_PEEK_BYTES]
+    if len(head) > 4096 and head.count(b"\n") < 4:
+        return _extract_api_calls_regex(data.decode("utf-8", "ignore"))
+
+    digest = hashlib.sha1(data).hexdigest() if _CACHE_ENABLED else None
+    if digest:
+        cached = _cache_load(digest)
+        if cached is not None:
+            return [_INTERNED_APIS.get(name, name) for name in cached]
+
+    code = data.decode("utf-8", "ignore")
+    api_calls = _extract_api_calls_ast(code, _looks_like_module(file_path, code))
+    if digest:
+        _cache_store(digest, api_calls)
+    return api_calls
+
 
+def _looks_like_module(file_path: str, code: str) -> bool:
+    """Guess whether a file is an ES module from its extension or first 4 KB."""
+    if file_path.lower().endswith(_MODULE_EXTENSIONS):
+        return True
+    head = code[:4096]
+    return "import " in head or "export " in head
+
+
+def _import_esprima() -> None:
+    """Import esprima into the module globals on first use."""
+    global esprima, Node
+    if esprima is None:
+        import esprima as esprima_module
+        from esprima.nodes import Node as esprima_node
+
+        esprima, Node = esprima_module, esprima_node
+
+
+def _extract_api_calls_ast(code: str, is_module: bool = False) -> list:
+    """
+    Parse source code with esprima and collect the React API calls used.
+
+    The likely parser is tried first, so ES modules are not parsed twice.
+    """
+    _import_esprima()
     api_calls = set()
 
+    if is_module:
+        parsers = (esprima.parseModule, esprima.parseScript)
+    else:
+        parsers = (esprima.parseScript, esprima.parseModule)
+
     try:
-        ast = esprima.parseScript(code, {"jsx": True, "tolerant": True})
+        ast = parsers[0](code, _PARSE_OPTIONS)
     except Exception:
         try:
-            ast = esprima.parseModule(code, {"jsx": True, "tolerant": True})
+            ast = parsers[1](code, _PARSE_OPTIONS)
         except Exception:
             # Fall back to regex if AST parsing fails
-            return extract_api_calls_regex(file_path)
-
-    def walk(node):
-        """Recursively walk the AST to find API usage patterns."""
-        if isinstance(node, dict):
-            node_type = node.get("type", "")
-
-            # ── MemberExpression: ReactDOM.render, React.createElement ──
-            if node_type == "MemberExpression":
-                obj = node.get("object", {})
-                prop = node.get("property", {})
-                obj_name = obj.get("name", "")
-                prop_name = prop.get("name", "")
-
-                if obj_name in REACT_MEMBER_APIS:
-                    full_name = f"{obj_name}.{prop_name}"
-                    if prop_name in REACT_MEMBER_APIS[obj_name]:
-                        api_calls.add(full_name)
-
-                # React.Children.map
-                if obj_name == "React" and prop_name == "Children":
-                    api_calls.add("React.Children.map")
-
-            # ── CallExpression: useState(), useEffect(), etc. ──
-            if node_type == "CallExpression":
-                callee = node.get("callee", {})
-                callee_name = callee.get("name", "")
-
-                if callee_name in REACT_HOOKS:
-                    api_calls.add(callee_name)
-                if callee_name in REACT_IMPORTS:
-                    api_calls.add(callee_name)
-
-            # ── ClassDeclaration: extends React.Component ──
-            if node_type == "ClassDeclaration":
-                superclass = node.get("superClass", {})
-                if isinstance(superclass, dict):
-                    obj = superclass.get("object", {})
-                    prop = superclass.get("property", {})
-                    if obj.get("name") == "React" and prop.get("name") in (
-                        "Component",
-                        "PureComponent",
-                    ):
-                        api_calls.add(f"React.{prop['name']}")
-
-            # ── JSXElement: <React.Fragment>, <React.StrictMode> ──
-            if node_type == "JSXMemberExpression":
-                obj = node.get("object", {})
-                prop = node.get("property", {})
-                if obj.get("name") == "React":
-                    comp_name = f"React.{prop.get('name', '')}"
-                    if comp_name in REACT_COMPONENT_APIS:
-                        api_calls.add(comp_name)
-
-            # ── ImportDeclaration: track imports ──
-            if node_type == "ImportDeclaration":
-                source = node.get("source", {}).get("value", "")
-                specifiers = node.get("specifiers", [])
-                for spec in specifiers:
-                    if isinstance(spec, dict):
-                        imported = spec.get("imported", {})
-                        local = spec.get("local", {})
-                        name = imported.get("name", "") or local.get("name", "")
-                        if name in REACT_IMPORTS:
-                            api_calls.add(name)
-                        if name in REACT_HOOKS:
-                            api_calls.add(name)
-
-            # Recurse into child nodes
-            for value in node.values():
-                if isinstance(value, (dict, list)):
-                    walk(value)
-
-        elif isinstance(node, list):
-            for item in node:
-                walk(item)
-
-    walk(ast.toDict() if hasattr(ast, "toDict") else ast)
-    return sorted(list(api_calls))
+            return _extract_api_calls_regex(code)
+
+    # Iterative walk over the esprima node objects
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        node_type = node.type
+        if node_type in _OPAQUE_TYPES:
+            continue
+
+        handler = _NODE_HANDLERS.get(node_type)
+        if handler is not None:
+            handler(node, api_calls)
+            # Nothing left to find once every known API has been seen
+            if len(api_calls) == len(_ALL_AST_APIS):
+                break
+
+        for value in node.__dict__.values():
+            if isinstance(value, Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, Node))
+
+    return sorted(api_calls)
 
 
 def extract_api_calls_regex(file_path: str) -> list:
@@ -164,49 +396,74 @@ def extract_api_calls_regex(file_path: str) -> list:
     with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
         code = f.read()
 
+    return _extract_api_calls_regex(code)
+
+
+def _extract_api_calls_regex(code: str) -> list:
+    """Collect React API calls from source code with the combined pattern."""
+    if _hyperscan_database() is not None:
+        return _extract_api_calls_hyperscan(code)
+
     api_calls = set()
 
-    # Match ReactDOM.method() calls
-    reactdom_pattern = r"ReactDOM\.(render|hydrate|unmountComponentAtNode|findDOMNode|createPortal|flushSync)\s*\("
-    for match in re.finditer(reactdom_pattern, code):
-        api_calls.add(f"ReactDOM.{match.group(1)}")
-
-    # Match React.method() calls
-    react_pattern = r"React\.(createElement|cloneElement|createRef|forwardRef|memo|lazy|createContext|isValidElement|startTransition)\s*[\(\<]"
-    for match in re.finditer(react_pattern, code):
-        api_calls.add(f"React.{match.group(1)}")
-
-    # Match React hooks
-    hooks_pattern = r"\b(useState|useEffect|useContext|useReducer|useCallback|useMemo|useRef|useImperativeHandle|useLayoutEffect|useDebugValue|useId|useTransition|useDeferredValue|useInsertionEffect|useSyncExternalStore)\s*\("
-    for match in re.finditer(hooks_pattern, code):
-        api_calls.add(match.group(1))
-
-    # Match createRoot / hydrateRoot
-    new_api_pattern = r"\b(createRoot|hydrateRoot)\s*\("
-    for match in re.finditer(new_api_pattern, code):
-        api_calls.add(match.group(1))
-
-    # Match class extends React.Component / React.PureComponent
-    class_pattern = r"extends\s+React\.(Component|PureComponent)"
-    for match in re.finditer(class_pattern, code):
-        api_calls.add(f"React.{match.group(1)}")
-
-    # Match React.Fragment, React.StrictMode, React.Suspense, React.Profiler
-    component_pattern = r"React\.(Fragment|StrictMode|Suspense|Profiler)"
-    for match in re.finditer(component_pattern, code):
-        api_calls.add(f"React.{match.group(1)}")
-
-    # Match React.Children.map
-    if re.search(r"React\.Children\.\w+", code):
-        api_calls.add("React.Children.map")
+    # Single pass over the file; every alternative captures the API name
+    # except React.Children.*, which is reported as React.Children.map.
+    for match in _REGEX_FALLBACK.finditer(code):
+        kind = match.lastgroup
+        if kind == "children":
+            api_calls.add("React.Children.map")
+        else:
+            name = match.group(kind)
+            api_calls.add(_INTERNED_APIS.get(name, name))
+
+    return sorted(api_calls)
+
+
+def _extract_api_calls_hyperscan(code: str) -> list:
+    """Collect React API calls from source code in one Hyperscan pass."""
+    api_calls = set()
+
+    def on_match(expr_id, start, end, flags, context):
+        api_calls.add(_HS_APIS[expr_id])
+
+    _HS_DATABASE.scan(code.encode("utf-8", "ignore"), match_event_handler=on_match)
+    return sorted(api_calls)
 
-    return sorted(list(api_calls))
+
+def _scan_file(file_path: str) -> tuple:
+    """
+    Extract API calls from one file, capturing any error.
+
+    Runs inside pool workers, so it must stay a module-level function.
+
+    Returns:
+        Tuple of (api_calls, error_message).
+    """
+    try:
+        return extract_api_calls_ast(file_path), None
+    except Exception as e:
+        return [], str(e)
+
+
+def _scan_jobs() -> int:
+    """Return the number of worker processes to use for a project scan."""
+    jobs = os.environ.get("BREAKGUARD_JOBS", "")
+    if jobs.isdigit() and int(jobs) > 0:
+        return int(jobs)
+    cpus = os.cpu_count() or 1
+    # APFS serializes directory reads, so extra workers stop helping on macOS
+    if sys.platform == "darwin":
+        return min(cpus, 8)
+    return cpus
 
 
 def scan_project(project_path: str) -> dict:
     """
     Scan an entire project directory for React API usage.
 
+    Files are collected first, then parsed across a process pool
+    (size set by BREAKGUARD_JOBS, default: one worker per CPU).
+
     Args:
         project_path: Path to the root of the project.
 
@@ -215,33 +472,93 @@ def scan_project(project_path: str) -> dict:
     """
     results = {}
     skipped = []
-    supported_extensions = {".js", ".jsx", ".tsx", ".ts", ".mjs"}
+    supported_extensions = (".js", ".jsx", ".tsx", ".ts", ".mjs")
 
     # Directories to skip
     skip_dirs = {"node_modules", ".git", "dist", "build", "__pycache__", ".next"}
 
-    for root, dirs, files in os.walk(project_path):
-        # Remove skip directories
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-
-        for file in files:
-            _, ext = os.path.splitext(file)
-            if ext.lower() in supported_extensions:
-                file_path = os.path.join(root, file)
-                try:
-                    calls = extract_api_calls_ast(file_path)
-                    if calls:
-                        results[file_path] = calls
-                except Exception as e:
-                    skipped.append((file_path, str(e)))
+    # Top-down walk with scandir, whose entries cache their file type
+    file_paths = []
+    stack = [project_path]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, list symlinked dirs but don't follow them
+                        if entry.name not in skip_dirs and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(supported_extensions):
+                        file_paths.append(entry.path)
+        except OSError:
+            continue
+        # Reversed so subdirectories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+    jobs = min(_scan_jobs(), len(file_paths))
+    if jobs > 1 and len(file_paths) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            scanned = list(executor.map(_scan_file, file_paths, chunksize=16))
+    else:
+        # Not worth the worker start-up cost for small projects
+        scanned = [_scan_file(file_path) for file_path in file_paths]
+
+    for file_path, (calls, error) in zip(file_paths, scanned):
+        if error is not None:
+            skipped.append((file_path, error))
+        elif calls:
+            # Worker results arrive as fresh unpickled strings
+            results[file_path] = [_INTERNED_APIS.get(name, name) for name in calls]
 
     return results
 
 
+def _line_breaks(buf):
+    """Return offsets of line endings (LF, CRLF or a lone CR) in a byte buffer."""
+    import numpy as np
+
+    data = np.frombuffer(buf, dtype=np.uint8)
+    is_lf = data == 10
+    is_cr = data == 13
+    # A CR directly before LF is part of the same line ending
+    is_cr[:-1] &= ~is_lf[1:]
+    return np.flatnonzero(is_lf | is_cr)
+
+
+def _find_lines(buf, parts: list) -> list:
+    """Return sorted line numbers containing every part, searching raw bytes."""
+    lines = None
+    breaks = None
+    for part in parts:
+        needle = part.encode()
+        step = len(needle) or 1
+        positions = []
+        pos = buf.find(needle)
+        while pos != -1:
+            positions.append(pos)
+            pos = buf.find(needle, pos + step)
+        if not positions:
+            return []
+
+        if breaks is None:
+            breaks = _line_breaks(buf)
+        found = set((breaks.searchsorted(positions, side="right") + 1).tolist())
+        lines = found if lines is None else lines & found
+        if not lines:
+            return []
+
+    return sorted(lines)
+
+
 def get_api_call_locations(file_path: str, api_call: str) -> list:
     """
     Find the line numbers where a specific API call appears in a file.
 
+    The file is memory-mapped and searched as bytes, so lines are never
+    decoded or iterated in Python.
+
     Args:
         file_path: Path to the file.
         api_call: The API call to search for (e.g., "ReactDOM.render").
@@ -249,27 +566,23 @@ def get_api_call_locations(file_path: str, api_call: str) -> list:
     Returns:
         List of line numbers (1-indexed) where the call appears.
     """
-    locations = []
+    # Member expressions also match lines containing every part,
+    # e.g. "React.Component" on "import React, { Component } ..."
+    parts = api_call.split(".") if "." in api_call else [api_call]
+
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line_num, line in enumerate(f, 1):
-                # Check for the API call in the line
-                if api_call in line:
-                    locations.append(line_num)
-                # Also check individual parts for member expressions
-                elif "." in api_call:
-                    parts = api_call.split(".")
-                    if all(part in line for part in parts):
-                        locations.append(line_num)
+        with open(file_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _find_lines(mm, parts)
+            except (ValueError, OSError):
+                # Empty and special files cannot be mapped
+                return _find_lines(f.read(), parts)
     except Exception:
-        pass
-
-    return locations
+        return []
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python code_analyzer.py <project_path>")
         sys.exit(1)
@@ -14,33 +14,37 @@ Examples:
 import argparse
 import os
 import sys
-import json
 import time
+from collections import defaultdict
+from functools import lru_cache
 
 # ─── ANSI Color Codes (Windows compatible) ──────────────────────
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    RED = Fore.RED
-    GREEN = Fore.GREEN
-    YELLOW = Fore.YELLOW
-    CYAN = Fore.CYAN
-    WHITE = Fore.WHITE
-    BOLD = Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    RED = ""
-    GREEN = ""
-    YELLOW = ""
-    CYAN = ""
-    WHITE = ""
-    BOLD = ""
-    RESET = ""
-
-
-def print_banner():
-    """Print the BreakGuard banner."""
-    banner = f"""
+# Colors are skipped entirely (colorama is not even imported) when output
+# is not a terminal or NO_COLOR is set.
+RED = ""
+GREEN = ""
+YELLOW = ""
+CYAN = ""
+WHITE = ""
+BOLD = ""
+RESET = ""
+
+if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+    try:
+        from colorama import init, Fore, Style
+        init(autoreset=True)
+        RED = Fore.RED
+        GREEN = Fore.GREEN
+        YELLOW = Fore.YELLOW
+        CYAN = Fore.CYAN
+        WHITE = Fore.WHITE
+        BOLD = Style.BRIGHT
+        RESET = Style.RESET_ALL
+    except ImportError:
+        pass
+
+
+_BANNER = f"""
 {CYAN}{BOLD}
   ╔══════════════════════════════════════════════════════════════╗
   ║                                                              ║
@@ -62,8 +66,12 @@ def print_banner():
   ║   Powered by Endee Vector Database                           ║
   ║                                                              ║
   ╚══════════════════════════════════════════════════════════════╝
-{RESET}"""
-    print(banner)
+{RESET}\n"""
+
+
+def print_banner():
+    """Print the BreakGuard banner."""
+    sys.stdout.write(_BANNER)
 
 
 def print_section(title: str, char: str = "═"):
@@ -157,6 +165,11 @@ Examples:
     # Import analyzer
     from analyzer.code_analyzer import scan_project, get_api_call_locations
 
+    # The report looks up the same (file, api) locations several times
+    @lru_cache(maxsize=None)
+    def get_locations(file_path: str, api_call: str) -> tuple:
+        return tuple(get_api_call_locations(file_path, api_call))
+
     print(f"  Scanning for {args.library} API calls...\n")
     api_usage = scan_project(project_path)
 
@@ -177,7 +190,7 @@ Examples:
         rel_path = os.path.relpath(file_path, project_path)
         print(f"    {CYAN}{rel_path}{RESET}")
         for call in calls:
-            locations = get_api_call_locations(file_path, call)
+            locations = get_locations(file_path, call)
             loc_str = f" (line{'s' if len(locations)>1 else ''}: {', '.join(map(str, locations))})" if locations else ""
             print(f"      - {call}{loc_str}")
 
@@ -216,13 +229,13 @@ Examples:
         print(f"  {RED}{BOLD}BREAKING CHANGES ({len(results['breaking_changes'])}){RESET}")
         print(f"{'─' * 60}")
 
-        # Group by unique API
-        seen = set()
+        # Group by unique API (dicts keep first-seen order)
+        by_api = defaultdict(list)
         for change in results["breaking_changes"]:
-            api = change["old_api"]
-            if api in seen:
-                continue
-            seen.add(api)
+            by_api[change["old_api"]].append(change)
+
+        for api, affected in by_api.items():
+            change = affected[0]
 
             print(f"\n  {RED}✗{RESET} {BOLD}{api}{RESET}")
             print(f"    Status:     {RED}BREAKING CHANGE{RESET}")
@@ -234,13 +247,10 @@ Examples:
                 print(f"    Message:     {change['message']}")
 
             # Show affected files
-            affected = [
-                c for c in results["breaking_changes"] if c["old_api"] == api
-            ]
             print(f"    Affected files ({len(affected)}):")
             for item in affected:
                 rel = os.path.relpath(item["file"], project_path)
-                locations = get_api_call_locations(item["file"], api)
+                locations = get_locations(item["file"], api)
                 loc = f":{locations[0]}" if locations else ""
                 print(f"      - {CYAN}{rel}{loc}{RESET}")
 
@@ -257,13 +267,11 @@ Examples:
         print(f"  {YELLOW}{BOLD}MINOR CHANGES ({len(results['minor_changes'])}){RESET}")
         print(f"{'─' * 60}")
 
-        seen = set()
+        first_by_api = {}
         for change in results["minor_changes"]:
-            api = change["old_api"]
-            if api in seen:
-                continue
-            seen.add(api)
+            first_by_api.setdefault(change["old_api"], change)
 
+        for api, change in first_by_api.items():
             print(f"\n  {YELLOW}~{RESET} {BOLD}{api}{RESET}")
             print(f"    Status:    {YELLOW}Review recommended{RESET}")
             print(f"    Similarity: {format_similarity_bar(change['similarity'])}")
@@ -287,12 +295,11 @@ Examples:
         print(f"  {GREEN}{BOLD}COMPATIBLE ({len(results['compatible'])}){RESET}")
         print(f"{'─' * 60}")
 
-        seen = set()
+        first_by_api = {}
         for item in results["compatible"]:
-            api = item.get("api", item.get("old_api", "unknown"))
-            if api in seen:
-                continue
-            seen.add(api)
+            first_by_api.setdefault(item.get("api", item.get("old_api", "unknown")), item)
+
+        for api, item in first_by_api.items():
             sim = item.get("similarity", 1.0)
             print(f"  {GREEN}✓{RESET} {api}  {format_similarity_bar(sim)}")
 
@@ -314,6 +321,8 @@ Examples:
 
     # ─── JSON Output ────────────────────────────────────────────
     if args.json_output:
+        import json
+
         output = {
             "library": args.library,
             "from_version": args.old_version,
@@ -6,9 +6,7 @@ Loads API documentation, generates embeddings, and stores them in Endee.
 import json
 import os
 import sys
-
-from endee import Endee, Precision
-from embeddings.embedding_engine import EmbeddingEngine
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # ─── Configuration ──────────────────────────────────────────────
@@ -23,6 +21,11 @@ def get_auth_token() -> str:
 ENDEE_AUTH_TOKEN = get_auth_token()
 INDEX_NAME = "api_versions"
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+UPSERT_BATCH_SIZE = 50
+UPSERT_WORKERS = 4
+
+# Vector precision: "int8" (default) or "float32" for A/B comparison
+KB_PRECISION = os.getenv("BREAKGUARD_KB_PRECISION", "int8").lower()
 
 
 def load_api_data(filepath: str) -> list:
@@ -31,6 +34,74 @@ def load_api_data(filepath: str) -> list:
         return json.load(f)
 
 
+def l2_normalize(vectors) -> list:
+    """
+    L2-normalize embeddings for upload to an INT8D index.
+
+    The server's int8d quantizer scales each vector by its own abs-max, so
+    sending unit-length floats and letting it quantize once keeps the
+    similarity error far lower than pre-rounding to a fixed grid here.
+
+    Args:
+        vectors: 2-D array-like of float embeddings.
+
+    Returns:
+        List of float lists with unit L2 norm.
+    """
+    import numpy as np
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).tolist()
+
+
+def build_record(api: dict, vector: list, version_key: str) -> dict:
+    """Build the Endee upsert record for one API entry and its embedding."""
+    version = api.get("version", version_key.replace("react", ""))
+    func_name = api["function"]
+
+    # Create a clean ID
+    safe_name = func_name.replace(".", "_").replace(" ", "_")
+    vector_id = f"react{version}_{safe_name}"
+
+    # Build metadata
+    meta = {
+        "library": "react",
+        "version": version,
+        "function": func_name,
+        "signature": api.get("signature", ""),
+        "description": api.get("description", ""),
+        "category": api.get("category", ""),
+        "deprecated": api.get("deprecated", False),
+    }
+
+    # Add replacement info if available
+    if api.get("replaces"):
+        meta["replaces"] = api["replaces"]
+    if api.get("replacedBy"):
+        meta["replacedBy"] = api["replacedBy"]
+    if api.get("migrateTo"):
+        meta["migrateTo"] = api["migrateTo"]
+    if api.get("importPath"):
+        meta["importPath"] = api["importPath"]
+
+    # Build filter for Endee queries
+    # Encode version as integer for $eq filter
+    version_num = int(version)
+    filter_data = {
+        "library": "react",
+        "version": version_num,
+    }
+
+    return {
+        "id": vector_id,
+        "vector": vector,
+        "meta": meta,
+        "filter": filter_data,
+    }
+
+
 def build_knowledge_base():
     """
     Main function to build the API knowledge base.
@@ -41,6 +112,10 @@ def build_knowledge_base():
     4. Generates embeddings for each API
     5. Upserts vectors into Endee
     """
+    # Heavy dependencies are only needed once the build actually runs
+    from endee import Endee, Precision
+    from embeddings.embedding_engine import EmbeddingEngine
+
     print("=" * 60)
     print("  BreakGuard - Building API Knowledge Base")
     print("=" * 60)
@@ -70,13 +145,14 @@ def build_knowledge_base():
     except Exception as e:
         print(f"  Note: Could not check existing indexes: {e}")
 
+    use_int8 = KB_PRECISION != "float32"
     client.create_index(
         name=INDEX_NAME,
         dimension=dimension,
         space_type="cosine",
-        precision=Precision.FLOAT32,
+        precision=Precision.INT8D if use_int8 else Precision.FLOAT32,
     )
-    print(f"  Index '{INDEX_NAME}' created successfully.")
+    print(f"  Index '{INDEX_NAME}' created successfully ({'int8' if use_int8 else 'float32'}).")
 
     index = client.get_index(name=INDEX_NAME)
 
@@ -88,77 +164,56 @@ def build_knowledge_base():
 
     total_stored = 0
 
-    for version_key, filepath in api_files.items():
-        print(f"\n[4/5] Processing {version_key}...")
-
-        if not os.path.exists(filepath):
-            print(f"  WARNING: File not found: {filepath}")
-            continue
-
-        apis = load_api_data(filepath)
-        print(f"  Loaded {len(apis)} API entries.")
-
-        # Generate embeddings for all APIs
-        texts = [engine.api_to_text(api) for api in apis]
-        vectors = engine.encode_batch(texts)
-
-        # Prepare upsert data
-        upsert_data = []
-        for api, vector in zip(apis, vectors):
-            version = api.get("version", version_key.replace("react", ""))
-            func_name = api["function"]
-
-            # Create a clean ID
-            safe_name = func_name.replace(".", "_").replace(" ", "_")
-            vector_id = f"react{version}_{safe_name}"
-
-            # Build metadata
-            meta = {
-                "library": "react",
-                "version": version,
-                "function": func_name,
-                "signature": api.get("signature", ""),
-                "description": api.get("description", ""),
-                "category": api.get("category", ""),
-                "deprecated": api.get("deprecated", False),
-            }
-
-            # Add replacement info if available
-            if api.get("replaces"):
-                meta["replaces"] = api["replaces"]
-            if api.get("replacedBy"):
-                meta["replacedBy"] = api["replacedBy"]
-            if api.get("migrateTo"):
-                meta["migrateTo"] = api["migrateTo"]
-            if api.get("importPath"):
-                meta["importPath"] = api["importPath"]
-
-            # Build filter for Endee queries
-            # Encode version as integer for $eq filter
-            version_num = int(version)
-            filter_data = {
-                "library": "react",
-                "version": version_num,
-            }
-
-            upsert_data.append(
-                {
-                    "id": vector_id,
-                    "vector": vector,
-                    "meta": meta,
-                    "filter": filter_data,
-                }
-            )
-
-        # Upsert in batches
-        batch_size = 50
-        for i in range(0, len(upsert_data), batch_size):
-            batch = upsert_data[i : i + batch_size]
-            index.upsert(batch)
-            print(f"  Upserted batch {i // batch_size + 1}: {len(batch)} vectors")
-
-        total_stored += len(upsert_data)
-        print(f"  Stored {len(upsert_data)} vectors for {version_key}")
+    # Encoding is compute-bound and runs on one worker; upserts are
+    # network-bound and overlap with it on a separate pool
+    api_to_text = engine.api_to_text
+    encode_batch = engine.encode_batch
+    with ThreadPoolExecutor(max_workers=1) as encode_pool, ThreadPoolExecutor(
+        max_workers=UPSERT_WORKERS
+    ) as upsert_pool:
+        for version_key, filepath in api_files.items():
+            print(f"\n[4/5] Processing {version_key}...")
+
+            if not os.path.exists(filepath):
+                print(f"  WARNING: File not found: {filepath}")
+                continue
+
+            apis = load_api_data(filepath)
+            print(f"  Loaded {len(apis)} API entries.")
+
+            # Embed batches on the encode pool; each batch is upserted as soon
+            # as its vectors are ready, while the next one is still encoding
+            batches = [
+                apis[i : i + UPSERT_BATCH_SIZE]
+                for i in range(0, len(apis), UPSERT_BATCH_SIZE)
+            ]
+            encode_futures = [
+                encode_pool.submit(encode_batch, list(map(api_to_text, batch)))
+                for batch in batches
+            ]
+
+            upsert_futures = {}
+            for batch_num, (batch, encode_future) in enumerate(
+                zip(batches, encode_futures), 1
+            ):
+                vectors = encode_future.result()
+                vectors = l2_normalize(vectors) if use_int8 else vectors.tolist()
+                records = [
+                    build_record(api, vector, version_key)
+                    for api, vector in zip(batch, vectors)
+                ]
+                future = upsert_pool.submit(index.upsert, records)
+                upsert_futures[future] = (batch_num, len(records))
+
+            stored = 0
+            for future in as_completed(upsert_futures):
+                future.result()
+                batch_num, count = upsert_futures[future]
+                stored += count
+                print(f"  Upserted batch {batch_num}: {count} vectors")
+
+            total_stored += stored
+            print(f"  Stored {stored} vectors for {version_key}")
 
     # ─── Step 5: Verify ─────────────────────────────────────────
     print(f"\n[5/5] Verification...")
@@ -4,6 +4,19 @@ Compares user code API calls against the new API version using vector similarity
 """
 
 import os
+import sys
+import json
+import time
+import atexit
+import hashlib
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Final, Mapping
+import numpy as np
 from endee import Endee
 from embeddings.embedding_engine import EmbeddingEngine
 
@@ -24,6 +37,135 @@ INDEX_NAME = "api_versions"
 BREAKING_THRESHOLD = 0.85   # Below this = breaking change
 MINOR_THRESHOLD = 0.95      # Below this = minor change, above = compatible
 
+# Concurrent Endee queries issued by check_project
+QUERY_WORKERS = 16
+
+# Closest new-version APIs considered per query
+QUERY_TOP_K = 5
+
+# Results remembered by each checker's check_api
+CHECK_API_CACHE_SIZE = 2048
+
+# Versions with fewer vectors than this are mirrored locally and searched
+# in-process; larger ones are queried on the server
+SNAPSHOT_MAX_VECTORS = 512
+
+# Server query results are reused for any later query vector at least this
+# cosine-similar to an earlier one (per library version, LRU-bounded)
+SIM_CACHE_THRESHOLD = 0.98
+SIM_CACHE_SIZE = 512
+
+# Keep-alive connections kept by the SDK's shared HTTP session
+HTTP_POOL_SIZE = 32
+HTTP_MAX_RETRIES = 2
+
+
+def configure_http_pool(client) -> None:
+    """
+    Size the Endee client's shared requests session for concurrent queries.
+
+    The SDK keeps one pooled session per client, but its default pool is
+    smaller than QUERY_WORKERS and blocks when exhausted. Clients using the
+    httpx transport (no session_manager) are left unchanged.
+
+    Args:
+        client: An Endee client, before any index is fetched from it.
+    """
+    manager = getattr(client, "session_manager", None)
+    if manager is None:
+        return
+    manager.close_session()
+    manager.pool_connections = HTTP_POOL_SIZE
+    manager.pool_maxsize = HTTP_POOL_SIZE
+    manager.max_retries = HTTP_MAX_RETRIES
+
+
+# ─── Latency Profiling ─────────────────────────────────────────
+# BREAKGUARD_PROFILE=1 records per-phase latencies of every check and
+# prints P50/P95/P99 on exit. Uses HdrHistogram when hdrh is installed.
+# "encode" samples one API; "encode_batch" samples one check_project batch.
+PROFILE_ENABLED = os.getenv("BREAKGUARD_PROFILE") == "1"
+PROFILE_PHASES = ("encode", "encode_batch", "query", "decide")
+
+try:
+    from hdrh.histogram import HdrHistogram
+    HAS_HDRH = True
+except ImportError:
+    HAS_HDRH = False
+
+
+class _LatencyHistogram:
+    """Thread-safe latency recorder (microseconds) for one phase."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        if HAS_HDRH:
+            self._hist = HdrHistogram(1, 60_000_000, 3)  # 1 µs .. 60 s
+        else:
+            self._values = []
+
+    def record(self, micros: int) -> None:
+        """Record one latency sample."""
+        micros = max(1, micros)
+        with self._lock:
+            self.count += 1
+            if HAS_HDRH:
+                self._hist.record_value(micros)
+            else:
+                self._values.append(micros)
+
+    def percentile(self, p: float) -> int:
+        """Return the latency at percentile p (0-100)."""
+        with self._lock:
+            if HAS_HDRH:
+                return self._hist.get_value_at_percentile(p)
+            return int(np.percentile(self._values, p)) if self._values else 0
+
+
+_LATENCY = {phase: _LatencyHistogram() for phase in PROFILE_PHASES}
+
+
+@contextmanager
+def _timeit(phase: str):
+    """Time the enclosed block into the phase's histogram when profiling."""
+    if not PROFILE_ENABLED:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _LATENCY[phase].record((time.perf_counter_ns() - start) // 1000)
+
+
+def _timed(phase: str):
+    """Decorator form of _timeit; a no-op unless profiling is enabled."""
+    def decorator(func):
+        if not PROFILE_ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timeit(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _print_latency_report() -> None:
+    """Print P50/P95/P99 per phase to stderr."""
+    print(f"\n  {'Phase':<14}{'n':>8}{'P50 µs':>12}{'P95 µs':>12}{'P99 µs':>12}", file=sys.stderr)
+    for phase, hist in _LATENCY.items():
+        if not hist.count:
+            continue
+        p50, p95, p99 = (hist.percentile(p) for p in (50, 95, 99))
+        print(f"  {phase:<14}{hist.count:>8}{p50:>12}{p95:>12}{p99:>12}", file=sys.stderr)
+
+
+if PROFILE_ENABLED:
+    atexit.register(_print_latency_report)
+
 
 # ─── Migration Guides ──────────────────────────────────────────
 MIGRATION_GUIDES = {
@@ -114,19 +256,210 @@ MIGRATION_GUIDES = {
     },
 }
 
+# Guide text per (API, version), resolved once for _get_migration
+_NO_MIGRATION_GUIDE = "  No specific migration guide available. Check the official documentation."
+_MIGRATION_CACHE = {
+    api: {
+        version: info.get("guide", "No migration guide available.")
+        for version, info in versions.items()
+        if info
+    }
+    for api, versions in MIGRATION_GUIDES.items()
+}
+
+
+# ─── Built-in Contexts ─────────────────────────────────────────
+# Semantic descriptions of the APIs the analyzer recognizes. Their
+# embeddings are precomputed once and stored next to this module.
+_CONTEXTS: Final[Mapping[str, str]] = MappingProxyType({
+    "ReactDOM.render": "ReactDOM.render: Render a React element into the DOM in the supplied container. Takes element, container, optional callback. Returns void.",
+    "ReactDOM.hydrate": "ReactDOM.hydrate: Hydrate server-rendered HTML content with React. Attach event listeners to existing markup. Takes element, container, optional callback.",
+    "ReactDOM.unmountComponentAtNode": "ReactDOM.unmountComponentAtNode: Remove a mounted React component from the DOM and clean up event handlers and state.",
+    "ReactDOM.findDOMNode": "ReactDOM.findDOMNode: Find the browser DOM node for a mounted React component instance.",
+    "ReactDOM.createPortal": "ReactDOM.createPortal: Render children into a DOM node outside the parent component hierarchy.",
+    "useState": "useState: Declare a state variable in a functional React component. Returns state value and setter function.",
+    "useEffect": "useEffect: Perform side effects in functional components. Runs after render. Accepts cleanup function.",
+    "useContext": "useContext: Read and subscribe to context from a React component.",
+    "useReducer": "useReducer: Manage complex state logic with a reducer function in React.",
+    "useCallback": "useCallback: Memoize a callback function to prevent unnecessary re-renders.",
+    "useMemo": "useMemo: Memoize an expensive computation result between re-renders.",
+    "useRef": "useRef: Create a mutable ref object that persists across renders.",
+    "useLayoutEffect": "useLayoutEffect: Fire effect synchronously after DOM mutations for layout reading.",
+    "useImperativeHandle": "useImperativeHandle: Customize ref instance value exposed to parent components.",
+    "useDebugValue": "useDebugValue: Display label for custom hooks in React DevTools.",
+    "React.Component": "React.Component: Base class for class-based React components with lifecycle methods and state.",
+    "React.PureComponent": "React.PureComponent: React component with shallow prop and state comparison for performance.",
+    "React.Fragment": "React.Fragment: Group children without adding extra DOM nodes.",
+    "React.Suspense": "React.Suspense: Display fallback while waiting for lazy-loaded children.",
+    "React.StrictMode": "React.StrictMode: Development tool for highlighting potential problems in React app.",
+    "React.createElement": "React.createElement: Create a new React element of the given type with props and children.",
+    "React.cloneElement": "React.cloneElement: Clone a React element with merged props.",
+    "React.createRef": "React.createRef: Create a ref to attach to React elements for DOM access.",
+    "React.forwardRef": "React.forwardRef: Forward ref to a child component.",
+    "React.memo": "React.memo: Memoize a component to skip re-rendering when props are unchanged.",
+    "React.lazy": "React.lazy: Define a dynamically loaded component for code splitting.",
+    "React.createContext": "React.createContext: Create a context for passing data through component tree.",
+    "React.Profiler": "React.Profiler: Measure rendering performance of React components.",
+    "React.Children.map": "React.Children.map: Iterate over children elements with a function.",
+    "React.isValidElement": "React.isValidElement: Check if an object is a valid React element.",
+    "createRoot": "createRoot: Create a concurrent React root for rendering. New React 18 API.",
+    "hydrateRoot": "hydrateRoot: Create a root for hydrating server-rendered content. New React 18 API.",
+})
+
+CONTEXT_VECTORS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contexts.npy")
+CONTEXT_META_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contexts.json")
+
+
+def _contexts_fingerprint(engine: EmbeddingEngine) -> dict:
+    """Describe what the stored context embeddings were computed from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for api, text in _CONTEXTS.items():
+        digest.update(f"{api}\0{text}\0".encode("utf-8"))
+    return {
+        "model": engine.model_name,
+        "backend": engine.backend,
+        "contexts": digest.hexdigest(),
+        "apis": list(_CONTEXTS),
+    }
+
+
+def precompute_context_embeddings(engine: EmbeddingEngine) -> dict:
+    """
+    Batch-encode the built-in contexts and save them next to this module.
+
+    Args:
+        engine: Embedding engine used for queries.
+
+    Returns:
+        Dict mapping API name to its float32 context embedding.
+    """
+    vectors = engine.encode_batch(list(_CONTEXTS.values()))
+    try:
+        np.save(CONTEXT_VECTORS_PATH, vectors)
+        with open(CONTEXT_META_PATH, "w", encoding="utf-8") as f:
+            json.dump(_contexts_fingerprint(engine), f, indent=2)
+    except OSError:
+        pass  # Read-only install: keep the in-memory copy
+    return dict(zip(_CONTEXTS, vectors))
+
+
+def load_context_embeddings(engine: EmbeddingEngine) -> dict:
+    """
+    Load the stored context embeddings, recomputing them if stale or missing.
+
+    Args:
+        engine: Embedding engine used for queries.
+
+    Returns:
+        Dict mapping API name to its float32 context embedding.
+    """
+    try:
+        with open(CONTEXT_META_PATH, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta == _contexts_fingerprint(engine):
+            vectors = np.load(CONTEXT_VECTORS_PATH)
+            if len(vectors) == len(_CONTEXTS):
+                return dict(zip(_CONTEXTS, vectors))
+    except (OSError, ValueError):
+        pass
+    return precompute_context_embeddings(engine)
+
+
+class _UncachedResult(Exception):
+    """Carries a check_api result that must not be memoized."""
+
+    def __init__(self, result: dict):
+        super().__init__(result.get("error", ""))
+        self.result = result
+
+
+def _to_payload(vector: np.ndarray) -> list:
+    """Convert a query vector to the list of floats the Endee SDK validates."""
+    return vector.tolist()
+
+
+def _version_filter(library: str, new_version: str) -> list:
+    """Build the Endee filter selecting one library version."""
+    return [
+        {"library": library},
+        {"version": int(new_version)},
+    ]
+
+
+def _load_index_snapshot(index, library: str, new_version: str, probe: np.ndarray):
+    """
+    Fetch every vector of one library version for in-process search.
+
+    Args:
+        index: Endee index handle.
+        library: Library name.
+        new_version: Target library version.
+        probe: Any query vector; only used to issue the listing query.
+
+    Returns:
+        (table, hits): an (N, d) float32 matrix of unit rows and the
+        matching result dicts without scores. None if the version holds
+        SNAPSHOT_MAX_VECTORS or more entries or vectors are not returned.
+    """
+    results = index.query(
+        vector=_to_payload(probe),
+        top_k=SNAPSHOT_MAX_VECTORS,
+        ef=SNAPSHOT_MAX_VECTORS,
+        filter=_version_filter(library, new_version),
+        include_vectors=True,
+    )
+    if not results or len(results) >= SNAPSHOT_MAX_VECTORS:
+        return None
+    if any(not r.get("vector") for r in results):
+        return None
+
+    table = np.asarray([r["vector"] for r in results], dtype=np.float32)
+    table /= np.clip(np.linalg.norm(table, axis=1, keepdims=True), 1e-12, None)
+    hits = [{"id": r.get("id"), "meta": r.get("meta", {})} for r in results]
+    return table, hits
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> Endee:
+    """Return the process-wide Endee client."""
+    client = Endee(ENDEE_AUTH_TOKEN) if ENDEE_AUTH_TOKEN else Endee()
+    client.set_base_url(ENDEE_BASE_URL)
+    configure_http_pool(client)
+    return client
+
+
+@lru_cache(maxsize=1)
+def _get_engine() -> EmbeddingEngine:
+    """Return the process-wide embedding engine."""
+    return EmbeddingEngine()
+
 
 class CompatibilityChecker:
     """Checks API compatibility between library versions using semantic similarity."""
 
     def __init__(self):
         """Initialize the checker with Endee client and embedding engine."""
-        if ENDEE_AUTH_TOKEN:
-            self.client = Endee(ENDEE_AUTH_TOKEN)
-        else:
-            self.client = Endee()
-        self.client.set_base_url(ENDEE_BASE_URL)
+        self.client = _get_client()
         self.index = self.client.get_index(name=INDEX_NAME)
-        self.engine = EmbeddingEngine()
+        self.engine = _get_engine()
+        self._snapshots = {}
+        self._snapshot_lock = threading.Lock()
+        self._sim_cache = {}
+        self._sim_lock = threading.Lock()
+        self._ctx_vec = load_context_embeddings(self.engine)
+
+        # Per-instance check_api memo; bump _cache_epoch to invalidate
+        self._cache_epoch = 0
+        self._check_api_cached = lru_cache(maxsize=CHECK_API_CACHE_SIZE)(self._check_api_frozen)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached results after the knowledge base has changed."""
+        self._cache_epoch += 1
+        self._check_api_cached.cache_clear()
+        with self._snapshot_lock:
+            self._snapshots.clear()
+        with self._sim_lock:
+            self._sim_cache.clear()
 
     def check_api(
         self,
@@ -147,29 +480,183 @@ class CompatibilityChecker:
         Returns:
             Dictionary with compatibility status, details, and migration info.
         """
-        # Build a semantic description
-        context = self._build_context(api_call)
-        query_vector = self.engine.encode(context)
-
-        # Query Endee for the new version
-        new_version_num = int(new_version)
         try:
-            results = self.index.query(
-                vector=query_vector,
-                top_k=5,
-                filter=[
-                    {"library": library},
-                    {"version": new_version_num},
-                ],
-                include_vectors=False,
+            result = self._check_api_cached(
+                api_call, old_version, new_version, library, self._cache_epoch
             )
+        except _UncachedResult as uncached:
+            return uncached.result
+        return dict(result)
+
+    def _check_api_frozen(
+        self, api_call: str, old_version: str, new_version: str, library: str, epoch: int
+    ) -> MappingProxyType:
+        """Compute a check_api result for the memo; failed queries are not kept."""
+        result = self._check_api_uncached(api_call, old_version, new_version, library)
+        if result["status"] == "error":
+            raise _UncachedResult(result)
+        return MappingProxyType(result)
+
+    def _check_api_uncached(
+        self, api_call: str, old_version: str, new_version: str, library: str
+    ) -> dict:
+        """Run the full check for one API call."""
+        known = self._known_break(api_call, new_version, library)
+        if known is not None:
+            return known
+
+        query_vector = self._build_query(api_call)
+        return self._evaluate(api_call, query_vector, new_version, library)
+
+    def _known_break(self, api_call: str, new_version: str, library: str):
+        """
+        Return the canonical result for an API with a documented migration.
+
+        APIs listed in MIGRATION_GUIDES for the target version are known
+        breaking changes, so they skip the embedding and index query.
+
+        Returns:
+            A breaking_change result dict, or None if the API is not listed.
+        """
+        if library != "react":
+            return None
+        guide = MIGRATION_GUIDES.get(api_call, {}).get(new_version)
+        if guide is None:
+            return None
+        replacement = guide["replacement"]
+        return {
+            "status": "breaking_change",
+            "old_api": api_call,
+            "new_api": replacement,
+            "similarity": 0.0,
+            "deprecated": True,
+            "message": f"{api_call} is DEPRECATED in v{new_version}. Use {replacement} instead.",
+            "migration": guide["guide"],
+            "confidence": 100.0,
+        }
+
+    @_timed("encode")
+    def _build_query(self, api_call: str) -> np.ndarray:
+        """Encode the semantic description of an API call into a query vector."""
+        vector = self._ctx_vec.get(api_call)
+        if vector is not None:
+            return vector
+        return self.engine.encode(self._build_context(api_call))
+
+    def _evaluate(
+        self,
+        api_call: str,
+        query_vector: np.ndarray,
+        new_version: str = "18",
+        library: str = "react",
+    ) -> dict:
+        """
+        Query Endee with a prepared vector and classify the API call.
+
+        Args:
+            api_call: The API function name (e.g., "ReactDOM.render")
+            query_vector: Embedding of the API call's semantic context
+            new_version: Target library version
+            library: Library name
+
+        Returns:
+            Dictionary with compatibility status, details, and migration info.
+        """
+        try:
+            results = self._query(query_vector, new_version, library)
         except Exception as e:
-            return {
-                "status": "error",
-                "api": api_call,
-                "error": str(e),
-            }
+            return self._error(api_call, e)
+        return self._decide(api_call, results, new_version, library)
 
+    @_timed("query")
+    def _query(self, query_vector: np.ndarray, new_version: str, library: str) -> list:
+        """
+        Find the closest APIs in the new version.
+
+        Searches the local snapshot of the version when one is available,
+        otherwise queries Endee.
+        """
+        query = query_vector / max(float(np.linalg.norm(query_vector)), 1e-12)
+        snapshot = self._snapshot(query_vector, new_version, library)
+        if snapshot is None:
+            key = (library, new_version)
+            results = self._sim_lookup(key, query)
+            if results is None:
+                results = self.index.query(
+                    vector=_to_payload(query_vector),
+                    top_k=QUERY_TOP_K,
+                    filter=_version_filter(library, new_version),
+                    include_vectors=False,
+                )
+                self._sim_store(key, query, results)
+            return results
+
+        table, hits = snapshot
+        scores = table @ query
+        k = min(QUERY_TOP_K, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [{**hits[i], "similarity": float(scores[i])} for i in top]
+
+    def _sim_lookup(self, key: tuple, query: np.ndarray):
+        """
+        Return cached server results for a near-identical earlier query.
+
+        Args:
+            key: (library, version) the results were filtered on.
+            query: Unit-length query vector.
+
+        Returns:
+            The cached results list, or None if no cached query reaches
+            SIM_CACHE_THRESHOLD.
+        """
+        with self._sim_lock:
+            entries = self._sim_cache.get(key)
+            if not entries:
+                return None
+            scores = np.stack([vector for vector, _ in entries]) @ query
+            best = int(np.argmax(scores))
+            if scores[best] < SIM_CACHE_THRESHOLD:
+                return None
+            entry = entries[best]
+            del entries[best]
+            entries.appendleft(entry)  # Most recently used first
+            return entry[1]
+
+    def _sim_store(self, key: tuple, query: np.ndarray, results: list) -> None:
+        """Remember server results for a unit-length query vector."""
+        with self._sim_lock:
+            entries = self._sim_cache.setdefault(key, deque(maxlen=SIM_CACHE_SIZE))
+            entries.appendleft((query, results))
+
+    def _snapshot(self, probe: np.ndarray, new_version: str, library: str):
+        """
+        Return the cached local snapshot of a version, loading it once.
+
+        A failed listing query is remembered as None, so the version is
+        queried on the server from then on instead of retrying the listing.
+        """
+        key = (library, new_version)
+        with self._snapshot_lock:
+            if key not in self._snapshots:
+                try:
+                    snapshot = _load_index_snapshot(self.index, library, new_version, probe)
+                except Exception:
+                    snapshot = None
+                self._snapshots[key] = snapshot
+            return self._snapshots[key]
+
+    def _error(self, api_call: str, error: Exception) -> dict:
+        """Build the result for an API call whose query failed."""
+        return {
+            "status": "error",
+            "api": api_call,
+            "error": str(error),
+        }
+
+    @_timed("decide")
+    def _decide(self, api_call: str, results: list, new_version: str, library: str) -> dict:
+        """Classify an API call from its Endee query results."""
         if not results:
             return {
                 "status": "breaking_change",
@@ -245,24 +732,57 @@ class CompatibilityChecker:
         for calls in api_usage.values():
             all_calls.update(calls)
 
-        # Check each unique API call
+        # APIs with a documented migration need no query
         results_cache = {}
         for api_call in sorted(all_calls):
-            result = self.check_api(api_call, old_version, new_version, library)
-            results_cache[api_call] = result
+            known = self._known_break(api_call, new_version, library)
+            if known is not None:
+                results_cache[api_call] = known
+        pending = [a for a in sorted(all_calls) if a not in results_cache]
+
+        # Reuse precomputed context embeddings; encode the rest in one batch
+        query_vectors = {a: self._ctx_vec[a] for a in pending if a in self._ctx_vec}
+        unknown = [a for a in pending if a not in query_vectors]
+        if unknown:
+            contexts = [self._build_context(a) for a in unknown]
+            with _timeit("encode_batch"):
+                vectors = self.engine.encode_batch(contexts)
+            query_vectors.update(zip(unknown, vectors))
+
+        # Fan the Endee queries out; classification stays on this thread
+        raw_results = {}
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as ex:
+            futures = {
+                ex.submit(self._query, query_vectors[api_call], new_version, library): api_call
+                for api_call in pending
+            }
+            for future in as_completed(futures):
+                api_call = futures[future]
+                try:
+                    raw_results[api_call] = future.result()
+                except Exception as e:
+                    raw_results[api_call] = e
+
+        for api_call in pending:
+            raw = raw_results[api_call]
+            if isinstance(raw, Exception):
+                results_cache[api_call] = self._error(api_call, raw)
+            else:
+                results_cache[api_call] = self._decide(api_call, raw, new_version, library)
 
         # Map results back to files
+        per_status = {
+            "breaking_change": breaking_changes,
+            "minor_change": minor_changes,
+            "error": errors,
+            "compatible": compatible,
+        }
         for file_path, calls in api_usage.items():
             for api_call in calls:
                 result = results_cache[api_call]
-                if result["status"] == "breaking_change":
-                    breaking_changes.append({"file": file_path, **result})
-                elif result["status"] == "minor_change":
-                    minor_changes.append({"file": file_path, **result})
-                elif result["status"] == "error":
-                    errors.append({"file": file_path, **result})
-                else:
-                    compatible.append({"file": file_path, **result})
+                per_status[result["status"]].append({"file": file_path, **result})
+
+        counts = Counter(r["status"] for r in results_cache.values())
 
         return {
             "breaking_changes": breaking_changes,
@@ -271,50 +791,16 @@ class CompatibilityChecker:
             "errors": errors,
             "summary": {
                 "total_apis": len(all_calls),
-                "breaking": len([r for r in results_cache.values() if r["status"] == "breaking_change"]),
-                "minor": len([r for r in results_cache.values() if r["status"] == "minor_change"]),
-                "compatible": len([r for r in results_cache.values() if r["status"] == "compatible"]),
-                "errors": len([r for r in results_cache.values() if r["status"] == "error"]),
+                "breaking": counts["breaking_change"],
+                "minor": counts["minor_change"],
+                "compatible": counts["compatible"],
+                "errors": counts["error"],
             },
         }
 
     def _build_context(self, api_call: str) -> str:
         """Build a semantic context string for an API call."""
-        contexts = {
-            "ReactDOM.render": "ReactDOM.render: Render a React element into the DOM in the supplied container. Takes element, container, optional callback. Returns void.",
-            "ReactDOM.hydrate": "ReactDOM.hydrate: Hydrate server-rendered HTML content with React. Attach event listeners to existing markup. Takes element, container, optional callback.",
-            "ReactDOM.unmountComponentAtNode": "ReactDOM.unmountComponentAtNode: Remove a mounted React component from the DOM and clean up event handlers and state.",
-            "ReactDOM.findDOMNode": "ReactDOM.findDOMNode: Find the browser DOM node for a mounted React component instance.",
-            "ReactDOM.createPortal": "ReactDOM.createPortal: Render children into a DOM node outside the parent component hierarchy.",
-            "useState": "useState: Declare a state variable in a functional React component. Returns state value and setter function.",
-            "useEffect": "useEffect: Perform side effects in functional components. Runs after render. Accepts cleanup function.",
-            "useContext": "useContext: Read and subscribe to context from a React component.",
-            "useReducer": "useReducer: Manage complex state logic with a reducer function in React.",
-            "useCallback": "useCallback: Memoize a callback function to prevent unnecessary re-renders.",
-            "useMemo": "useMemo: Memoize an expensive computation result between re-renders.",
-            "useRef": "useRef: Create a mutable ref object that persists across renders.",
-            "useLayoutEffect": "useLayoutEffect: Fire effect synchronously after DOM mutations for layout reading.",
-            "useImperativeHandle": "useImperativeHandle: Customize ref instance value exposed to parent components.",
-            "useDebugValue": "useDebugValue: Display label for custom hooks in React DevTools.",
-            "React.Component": "React.Component: Base class for class-based React components with lifecycle methods and state.",
-            "React.PureComponent": "React.PureComponent: React component with shallow prop and state comparison for performance.",
-            "React.Fragment": "React.Fragment: Group children without adding extra DOM nodes.",
-            "React.Suspense": "React.Suspense: Display fallback while waiting for lazy-loaded children.",
-            "React.StrictMode": "React.StrictMode: Development tool for highlighting potential problems in React app.",
-            "React.createElement": "React.createElement: Create a new React element of the given type with props and children.",
-            "React.cloneElement": "React.cloneElement: Clone a React element with merged props.",
-            "React.createRef": "React.createRef: Create a ref to attach to React elements for DOM access.",
-            "React.forwardRef": "React.forwardRef: Forward ref to a child component.",
-            "React.memo": "React.memo: Memoize a component to skip re-rendering when props are unchanged.",
-            "React.lazy": "React.lazy: Define a dynamically loaded component for code splitting.",
-            "React.createContext": "React.createContext: Create a context for passing data through component tree.",
-            "React.Profiler": "React.Profiler: Measure rendering performance of React components.",
-            "React.Children.map": "React.Children.map: Iterate over children elements with a function.",
-            "React.isValidElement": "React.isValidElement: Check if an object is a valid React element.",
-            "createRoot": "createRoot: Create a concurrent React root for rendering. New React 18 API.",
-            "hydrateRoot": "hydrateRoot: Create a root for hydrating server-rendered content. New React 18 API.",
-        }
-        return contexts.get(api_call, f"{api_call}: React API function call")
+        return _CONTEXTS.get(api_call) or f"{api_call}: React API function call"
 
     def _get_break_message(self, old_api: str, new_api: str, meta: dict) -> str:
         """Generate a breaking change message."""
@@ -328,10 +814,7 @@ class CompatibilityChecker:
 
     def _get_migration(self, api_call: str, new_version: str) -> str:
         """Get migration guide for an API call."""
-        guide_info = MIGRATION_GUIDES.get(api_call, {}).get(new_version, {})
-        if guide_info:
-            return guide_info.get("guide", "No migration guide available.")
-        return "  No specific migration guide available. Check the official documentation."
+        return _MIGRATION_CACHE.get(api_call, {}).get(new_version, _NO_MIGRATION_GUIDE)
 
 
 if __name__ == "__main__":
@@ -3,11 +3,340 @@ BreakGuard - Embeddings Module
 Handles conversion of API descriptions to semantic vector embeddings.
 """
 
+import atexit
+import hashlib
+import os
+import shelve
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 # Default model: all-MiniLM-L6-v2 produces 384-dimensional vectors
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
+CACHE_ROOT = os.getenv("BREAKGUARD_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "breakguard"
+)
+
+# Opt-in persistent cache for encode() results (BREAKGUARD_EMBED_CACHE=1)
+EMBED_CACHE_ENABLED = os.getenv("BREAKGUARD_EMBED_CACHE") == "1"
+EMBED_CACHE_PATH = os.path.join(CACHE_ROOT, "embeddings")
+
+# Opt-in INT8 ONNX Runtime backend (BREAKGUARD_USE_ORT=1)
+USE_ORT = os.getenv("BREAKGUARD_USE_ORT") == "1"
+ORT_EXPORT_DIR = os.path.join(CACHE_ROOT, "onnx")
+
+# Opt-in transformers backend with Numba pooling (BREAKGUARD_USE_NUMBA=1).
+# It reimplements mean pooling + normalization only, so it suits models
+# like the default and not CLS- or max-pooled ones.
+USE_NUMBA = os.getenv("BREAKGUARD_USE_NUMBA") == "1"
+
+# Torch models run on this device (BREAKGUARD_DEVICE=cuda to use a GPU)
+EMBED_DEVICE = os.getenv("BREAKGUARD_DEVICE", "cpu")
+
+# Token limit of the raw-transformer backends (matches all-MiniLM-L6-v2)
+MAX_SEQ_LENGTH = 256
+
+# Optional: compiled pooling for the raw-transformer backends
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+@lru_cache(maxsize=1)
+def _configure_torch_threads() -> int:
+    """
+    Size torch's CPU thread pools to the physical cores, once per process.
+
+    Returns:
+        The intra-op thread count.
+    """
+    threads = max(1, (os.cpu_count() or 2) // 2)
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Inter-op pool already started; keep its size
+    print(f"  Torch threads: {threads}")
+    return threads
+
+
+# ─── Pooling ───────────────────────────────────────────────────
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mean_pool_norm_kernel(hidden, mask):
+        """Numba kernel behind _mean_pool_normalize."""
+        batch, tokens, dim = hidden.shape
+        out = np.zeros((batch, dim), dtype=np.float32)
+        for b in prange(batch):
+            count = 0.0
+            for t in range(tokens):
+                weight = mask[b, t]
+                if weight != 0.0:
+                    count += weight
+                    for h in range(dim):
+                        out[b, h] += hidden[b, t, h] * weight
+            count = max(count, 1e-9)
+            sq = 0.0
+            for h in range(dim):
+                out[b, h] /= count
+                sq += out[b, h] * out[b, h]
+            inv = 1.0 / max(np.sqrt(sq), 1e-12)
+            for h in range(dim):
+                out[b, h] *= inv
+        return out
+
+
+def _mean_pool_normalize(hidden, mask):
+    """
+    Mean-pool token embeddings over the attention mask and L2-normalize.
+
+    Mirrors the Pooling + Normalize modules of sentence-transformers models.
+    Runs as a compiled Numba kernel when numba is installed.
+
+    Args:
+        hidden: (batch, tokens, dim) last hidden state.
+        mask: (batch, tokens) attention mask.
+
+    Returns:
+        (batch, dim) float32 array of unit vectors.
+    """
+    if _HAVE_NUMBA:
+        return _mean_pool_norm_kernel(
+            np.ascontiguousarray(hidden, dtype=np.float32),
+            np.ascontiguousarray(mask, dtype=np.float32),
+        )
+    mask = mask[..., None].astype(np.float32)
+    summed = (hidden * mask).sum(axis=1)
+    pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+    norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+    return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+# ─── Raw Transformer Backends ──────────────────────────────────
+
+def _hub_repo(model_name: str) -> str:
+    """Resolve a sentence-transformers short name to its Hub repo id."""
+    return model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+
+
+class _RawEncoder(ABC):
+    """
+    Tokenizer + transformer forward pass + pooling, without sentence-transformers.
+
+    Subclasses set self.tokenizer and self._dimension and implement
+    _forward(). Exposes the subset of the SentenceTransformer interface
+    that EmbeddingEngine relies on.
+    """
+
+    @abstractmethod
+    def _forward(self, tokens) -> np.ndarray:
+        """Return the (batch, tokens, dim) last hidden state for a tokenized batch."""
+
+    def _warm_up(self):
+        """Compile the pooling kernel before the first real batch."""
+        if _HAVE_NUMBA:
+            _mean_pool_normalize(
+                np.zeros((1, 4, self._dimension), dtype=np.float32),
+                np.ones((1, 4), dtype=np.int64),
+            )
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the embedding dimension."""
+        return self._dimension
+
+    def encode(self, sentences, batch_size: int = 32, **_):
+        """
+        Encode one text or a list of texts.
+
+        Args:
+            sentences: A string or list of strings.
+            batch_size: Texts per forward pass.
+
+        Returns:
+            A (dim,) array for a string, else a (n, dim) array.
+        """
+        if isinstance(sentences, str):
+            return self.encode_batch([sentences], batch_size)[0]
+        return self.encode_batch(sentences, batch_size)
+
+    def encode_batch(self, texts: list, batch_size: int = 32):
+        """Encode a list of texts into a (n, dim) float32 array."""
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQ_LENGTH,
+                return_tensors="np",
+            )
+            hidden = self._forward(tokens)
+            chunks.append(_mean_pool_normalize(hidden, tokens["attention_mask"]))
+        if not chunks:
+            return np.zeros((0, self._dimension), dtype=np.float32)
+        return np.concatenate(chunks)
+
+
+class _TransformersEncoder(_RawEncoder):
+    """PyTorch transformers model with compiled pooling (BREAKGUARD_USE_NUMBA=1)."""
+
+    def __init__(self, model_name: str):
+        """
+        Load the tokenizer and transformer backbone.
+
+        Args:
+            model_name: sentence-transformers model name or Hub repo id.
+        """
+        from transformers import AutoModel, AutoTokenizer
+
+        repo = _hub_repo(model_name)
+        self.tokenizer = AutoTokenizer.from_pretrained(repo)
+        self.model = AutoModel.from_pretrained(repo).to(EMBED_DEVICE).eval()
+        self._dimension = self.model.config.hidden_size
+        self._warm_up()
+
+    def _forward(self, tokens) -> np.ndarray:
+        """Run the backbone on a tokenized batch."""
+        inputs = {
+            name: torch.from_numpy(array).to(EMBED_DEVICE)
+            for name, array in tokens.items()
+        }
+        with torch.inference_mode():
+            return self.model(**inputs).last_hidden_state.cpu().numpy()
+
+
+class _OrtEncoder(_RawEncoder):
+    """
+    INT8-quantized ONNX Runtime encoder for a sentence-transformers model.
+
+    The model is exported and dynamically quantized on first use, then
+    reused from ORT_EXPORT_DIR.
+    """
+
+    def __init__(self, model_name: str):
+        """
+        Export (if needed) and load the quantized model.
+
+        Args:
+            model_name: sentence-transformers model name or Hub repo id.
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        repo = _hub_repo(model_name)
+        export_dir = os.path.join(ORT_EXPORT_DIR, repo.replace("/", "__"))
+        quantized_path = os.path.join(export_dir, "model_int8.onnx")
+
+        if not os.path.exists(quantized_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+
+            print("  Exporting model to ONNX (first run only)...")
+            ORTModelForFeatureExtraction.from_pretrained(repo, export=True).save_pretrained(export_dir)
+            AutoTokenizer.from_pretrained(repo).save_pretrained(export_dir)
+            quantize_dynamic(
+                os.path.join(export_dir, "model.onnx"),
+                quantized_path,
+                weight_type=QuantType.QInt8,
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            quantized_path, options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        self._input_names = [i.name for i in self.session.get_inputs()]
+        self._dimension = self.session.get_outputs()[0].shape[-1]
+        self._warm_up()
+
+    def _forward(self, tokens) -> np.ndarray:
+        """Run the ONNX session on a tokenized batch."""
+        feeds = {
+            name: tokens[name].astype(np.int64)
+            for name in self._input_names
+            if name in tokens
+        }
+        return self.session.run(None, feeds)[0]
+
+
+# ─── Persistent Embedding Cache ────────────────────────────────
+# One shelve handle per process, shared by every EmbeddingEngine: separate
+# handles on the same file lose writes (dbm.dumb) or fail to lock (gdbm)
+_DISK_CACHE = None
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _open_disk_cache():
+    """Open the shared store on first use; the caller holds _DISK_CACHE_LOCK."""
+    global _DISK_CACHE
+    if _DISK_CACHE is None:
+        os.makedirs(os.path.dirname(EMBED_CACHE_PATH), exist_ok=True)
+        _DISK_CACHE = shelve.open(EMBED_CACHE_PATH)
+        atexit.register(_DISK_CACHE.close)
+    return _DISK_CACHE
+
+
+def _disk_cache_get(key: str):
+    """Return the cached vector bytes for a key, or None."""
+    with _DISK_CACHE_LOCK:
+        return _open_disk_cache().get(key)
+
+
+def _disk_cache_put(key: str, data: bytes) -> None:
+    """Store vector bytes for a key."""
+    with _DISK_CACHE_LOCK:
+        _open_disk_cache()[key] = data
+
+
+# ─── Model Loading ─────────────────────────────────────────────
+# Loaded models are shared by every EmbeddingEngine in the process
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _load_model(model_name: str):
+    """
+    Return the (model, backend, dimension) for a model name, loading it once.
+
+    Args:
+        model_name: Name of the sentence-transformers model to use.
+
+    Returns:
+        Tuple of the encoder object, its backend label, and its dimension.
+    """
+    with _MODEL_LOCK:
+        cached = _MODEL_CACHE.get(model_name)
+        if cached is not None:
+            return cached
+
+        print(f"  Loading embedding model: {model_name}...")
+        if USE_ORT:
+            model = _OrtEncoder(model_name)
+            backend = "onnxruntime-int8"
+        elif USE_NUMBA and _HAVE_NUMBA:
+            _configure_torch_threads()
+            model = _TransformersEncoder(model_name)
+            backend = "transformers-numba"
+        else:
+            _configure_torch_threads()
+            model = SentenceTransformer(model_name, device=EMBED_DEVICE)
+            model.eval()
+            backend = "sentence-transformers"
+        dimension = model.get_sentence_embedding_dimension()
+        print(f"  Model loaded. Dimension: {dimension}")
+
+        cached = _MODEL_CACHE[model_name] = (model, backend, dimension)
+        return cached
+
 
 class EmbeddingEngine:
     """Generates semantic embeddings from API descriptions."""
@@ -19,10 +348,11 @@ class EmbeddingEngine:
         Args:
             model_name: Name of the sentence-transformers model to use.
         """
-        print(f"  Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
-        self.dimension = self.model.get_sentence_embedding_dimension()
-        print(f"  Model loaded. Dimension: {self.dimension}")
+        self.model_name = model_name
+        self.model, self.backend, self.dimension = _load_model(model_name)
+
+        # encode() cache: in-memory always, on disk when enabled
+        self._mem_cache = {}
 
     def api_to_text(self, api: dict) -> str:
         """
@@ -70,20 +400,43 @@ class EmbeddingEngine:
 
         return ". ".join(parts)
 
-    def encode(self, text: str) -> list:
+    def encode(self, text: str) -> np.ndarray:
         """
         Encode a text string into a vector embedding.
 
+        Results are memoized per engine, and persisted across runs when
+        BREAKGUARD_EMBED_CACHE=1.
+
         Args:
             text: The text to encode.
 
         Returns:
-            List of floats representing the embedding vector.
+            Read-only float32 array of shape (dimension,).
         """
-        vector = self.model.encode(text)
-        return vector.tolist()
+        key = self._cache_key(text)
+        vector = self._mem_cache.get(key)
+
+        if vector is None and EMBED_CACHE_ENABLED:
+            raw = _disk_cache_get(key)
+            if raw is not None:
+                vector = np.frombuffer(raw, dtype=np.float32)
+
+        if vector is None:
+            with torch.inference_mode():
+                vector = np.asarray(self.model.encode(text), dtype=np.float32)
+            vector.flags.writeable = False
+            if EMBED_CACHE_ENABLED:
+                _disk_cache_put(key, vector.tobytes())
+
+        self._mem_cache[key] = vector
+        return vector
+
+    def _cache_key(self, text: str) -> str:
+        """Return the encode() cache key for a text under this model."""
+        data = f"{self.model_name}\0{self.backend}\0{text}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
-    def encode_api(self, api: dict) -> list:
+    def encode_api(self, api: dict) -> np.ndarray:
         """
         Encode an API entry directly into a vector.
 
@@ -91,12 +444,12 @@ class EmbeddingEngine:
             api: Dictionary with API information.
 
         Returns:
-            List of floats representing the embedding vector.
+            Read-only float32 array of shape (dimension,).
         """
         text = self.api_to_text(api)
         return self.encode(text)
 
-    def encode_batch(self, texts: list) -> list:
+    def encode_batch(self, texts: list) -> np.ndarray:
         """
         Encode multiple texts at once for efficiency.
 
@@ -104,7 +457,8 @@ class EmbeddingEngine:
             texts: List of text strings.
 
         Returns:
-            List of embedding vectors.
+            Float32 array of shape (len(texts), dimension).
         """
-        vectors = self.model.encode(texts)
-        return [v.tolist() for v in vectors]
+        with torch.inference_mode():
+            vectors = self.model.encode(texts, batch_size=32, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dimension)
@@ -50,10 +50,6 @@ def main():
     print("\n[Step 3] Similarity Examples...")
     import numpy as np
 
-    def cosine_sim(a, b):
-        a, b = np.array(a), np.array(b)
-        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
-
     pairs = [
         ("ReactDOM.render: Render React element into DOM",
          "createRoot: Create a React root for rendering"),
@@ -63,10 +59,13 @@ def main():
          "console.log: Print to console"),
     ]
 
-    for t1, t2 in pairs:
-        v1 = engine.encode(t1)
-        v2 = engine.encode(t2)
-        sim = cosine_sim(v1, v2)
+    # Encode every text in one batch; cosine = dot product of unit vectors
+    flat = [t for pair in pairs for t in pair]
+    vecs = engine.encode_batch(flat)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    sims = np.einsum("ij,ij->i", vecs[0::2], vecs[1::2])
+
+    for (t1, t2), sim in zip(pairs, sims):
         print(f"  sim('{t1[:30]}...', '{t2[:30]}...') = {sim:.4f}")
 
     # ─── Step 4: Run full check (requires Endee) ───────────────